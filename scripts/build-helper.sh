@@ -15,8 +15,10 @@ echo "Building fluid-helper..."
 cd "$HELPER_DIR"
 
 # Build universal binary for both arm64 and x86_64
+# Cross-module optimization lets the optimizer inline/specialize across the
+# FluidAudio dependency boundary, which matters on the per-sample audio paths
 echo "Compiling for arm64 and x86_64..."
-swift build -c release --arch arm64 --arch x86_64
+swift build -c release --arch arm64 --arch x86_64 -Xswiftc -cross-module-optimization
 
 # Create bin directory if it doesn't exist
 mkdir -p "$BIN_DIR"
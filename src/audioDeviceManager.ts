@@ -26,7 +26,21 @@ export async function setSelectedDevice(deviceId: string): Promise<void> {
   );
 }
 
+// Device list cache: system_profiler takes on the order of a second to run,
+// and the status bar / menu refresh paths list devices repeatedly. A short
+// TTL keeps the list fresh enough to pick up newly plugged-in devices.
+const DEVICE_LIST_CACHE_TTL_MS = 30000;
+let cachedDevices: AudioDevice[] | null = null;
+let cachedDevicesTimestamp = 0;
+
 export async function listAudioDevices(): Promise<AudioDevice[]> {
+  if (
+    cachedDevices &&
+    Date.now() - cachedDevicesTimestamp < DEVICE_LIST_CACHE_TTL_MS
+  ) {
+    return cachedDevices;
+  }
+
   return new Promise<AudioDevice[]>((resolve, reject) => {
     // Use system_profiler to get audio devices
     exec("system_profiler SPAudioDataType -json", (error, stdout, stderr) => {
@@ -56,7 +70,9 @@ export async function listAudioDevices(): Promise<AudioDevice[]> {
         }
 
         // Always include default as first option
-        resolve([{ id: "default", name: "Default Device" }, ...devices]);
+        cachedDevices = [{ id: "default", name: "Default Device" }, ...devices];
+        cachedDevicesTimestamp = Date.now();
+        resolve(cachedDevices);
       } catch (parseError) {
         console.error("Error parsing system_profiler output:", parseError);
         reject(parseError);
@@ -67,8 +83,10 @@ export async function listAudioDevices(): Promise<AudioDevice[]> {
 
 /**
  * Show a quick pick menu to select input device
+ * Returns the selected device, so callers don't have to re-list devices
+ * just to look up its name
  */
-export async function selectAudioDevice(): Promise<string | undefined> {
+export async function selectAudioDevice(): Promise<AudioDevice | undefined> {
   const devices = await listAudioDevices();
   const currentDevice = getSelectedDevice();
 
@@ -92,7 +110,7 @@ export async function selectAudioDevice(): Promise<string | undefined> {
   const selectedDevice = devices.find((d) => d.name === selected.label);
   if (selectedDevice) {
     await setSelectedDevice(selectedDevice.id);
-    return selectedDevice.id;
+    return selectedDevice;
   }
 
   return undefined;
@@ -84,8 +84,11 @@ export function activate(context: vscode.ExtensionContext) {
   }
 
   async function refreshStatusBar() {
-    const deviceDisplayName = await getDeviceDisplayName();
-    const authState = await getAuthState();
+    // Device and auth lookups are independent - run them concurrently
+    const [deviceDisplayName, authState] = await Promise.all([
+      getDeviceDisplayName(),
+      getAuthState(),
+    ]);
     updateStatusBar(
       statusBarItem,
       isRecording,
@@ -111,6 +114,9 @@ export function activate(context: vscode.ExtensionContext) {
   // Fluid helper process for transcription/diarization
   let fluidHelper: ChildProcess | null = null;
   let fluidHelperReady = false;
+  // In-flight helper startup - concurrent callers await this instead of
+  // spawning a second process
+  let fluidHelperStartPromise: Thenable<void> | null = null;
 
   // Real-time processing state
   let processedSegmentCount = 0;
@@ -120,6 +126,9 @@ export function activate(context: vscode.ExtensionContext) {
   const SEGMENT_BATCH_DEBOUNCE_MS = 500;
   let pendingSegmentsQueue: SpeakerSegment[] = [];
   let segmentBatchDebounceTimer: ReturnType<typeof setTimeout> | null = null;
+  // Chain of in-flight batch work - flushes are queued onto it so batches are
+  // processed one at a time, in order (same pattern as ContextCollector)
+  let segmentFlushChain: Promise<void> = Promise.resolve();
 
   // Model download timeout: 15 minutes for first-run downloads (~650MB)
   const MODEL_DOWNLOAD_TIMEOUT_MS = 900000;
@@ -140,8 +149,21 @@ export function activate(context: vscode.ExtensionContext) {
       return;
     }
 
+    // Single-flight: the startup preload, handleStartRecording and the
+    // downloadModels command can race here - join the in-flight startup
+    // rather than spawning and initializing a second helper process
+    if (fluidHelperStartPromise) {
+      await fluidHelperStartPromise;
+      if (showSuccessMessage) {
+        vscode.window.showInformationMessage(
+          "Speech models downloaded and ready! You can now start recording.",
+        );
+      }
+      return;
+    }
+
     // Show progress while loading models (can take a while on first run)
-    await vscode.window.withProgress(
+    const start = vscode.window.withProgress(
       {
         location: vscode.ProgressLocation.Notification,
         title: "Loading Speech Models",
@@ -216,6 +238,15 @@ export function activate(context: vscode.ExtensionContext) {
         });
       },
     );
+
+    fluidHelperStartPromise = start;
+    // Clear once settled: on success later calls take the ready fast path
+    // above, on failure the next call retries from scratch
+    const clearStartPromise = () => {
+      fluidHelperStartPromise = null;
+    };
+    start.then(clearStartPromise, clearStartPromise);
+    return start;
   }
 
   // Track model download progress notification
@@ -375,13 +406,21 @@ export function activate(context: vscode.ExtensionContext) {
 
   /**
    * Flush pending segments: take current queue and process in one batch (Gemini + comment locations)
+   * Flushes are serialized - a debounce flush and the final flush on "done"
+   * would otherwise run concurrently and could post comments out of order
    */
-  async function flushPendingSegments(): Promise<void> {
-    if (pendingSegmentsQueue.length === 0) {
-      return;
-    }
-    const batch = pendingSegmentsQueue.splice(0);
-    await processSegmentsBatch(batch);
+  function flushPendingSegments(): Promise<void> {
+    const flush = segmentFlushChain.then(async () => {
+      if (pendingSegmentsQueue.length === 0) {
+        return;
+      }
+      const batch = pendingSegmentsQueue.splice(0);
+      await processSegmentsBatch(batch);
+    });
+    // Keep the chain usable after a failed flush; the error still reaches
+    // this flush's caller through the returned promise
+    segmentFlushChain = flush.catch(() => {});
+    return flush;
   }
 
   /**
@@ -526,15 +565,11 @@ export function activate(context: vscode.ExtensionContext) {
   }
 
   async function handleSelectDevice(): Promise<void> {
-    const selectedDeviceId = await selectAudioDevice();
-    if (selectedDeviceId) {
+    const selectedDevice = await selectAudioDevice();
+    if (selectedDevice) {
       await refreshStatusBar();
-      // Look up device name for the message
-      const devices = await listAudioDevices();
-      const device = devices.find((d) => d.id === selectedDeviceId);
-      const deviceName = device?.name || selectedDeviceId;
       vscode.window.showInformationMessage(
-        `Audio input device set to: ${deviceName}`,
+        `Audio input device set to: ${selectedDevice.name}`,
       );
     }
   }
@@ -558,8 +593,10 @@ export function activate(context: vscode.ExtensionContext) {
   const showMenuDisposable = vscode.commands.registerCommand(
     "pr-notes.showMenu",
     async () => {
-      const deviceDisplayName = await getDeviceDisplayName();
-      const authState = await getAuthState();
+      const [deviceDisplayName, authState] = await Promise.all([
+        getDeviceDisplayName(),
+        getAuthState(),
+      ]);
       const callbacks: StatusBarCallbacks = {
         onStartRecording: handleStartRecording,
         onStopRecording: handleStopRecording,
@@ -641,6 +678,18 @@ export function activate(context: vscode.ExtensionContext) {
     },
   );
 
+  // Optionally pre-warm the helper on startup so the first recording doesn't
+  // pay for model loading (and, on first run, the model download)
+  const preloadModels =
+    vscode.workspace
+      .getConfiguration("pr-notes")
+      .get<boolean>("preloadModels") ?? false;
+  if (preloadModels) {
+    startFluidHelper().catch((err) =>
+      console.error("Failed to preload speech models:", err),
+    );
+  }
+
   context.subscriptions.push(statusBarItem);
   context.subscriptions.push(commentController);
   context.subscriptions.push(showMenuDisposable);
@@ -1,6 +1,7 @@
 import Foundation
 import FluidAudio
 import AVFoundation
+import Accelerate
 
 /// Processes audio using FluidAudio for ASR and speaker diarization
 actor AudioProcessor {
@@ -30,22 +31,30 @@ actor AudioProcessor {
     
     // Track last known speaker from diarization
     private var currentSpeakerId: Int = 0
+
+    // Speaker labels come from a small fixed set ("Speaker_0", ...), so the
+    // parse result is memoized instead of re-filtering the string per segment
+    private var speakerIdCache: [String: Int] = [:]
     
     /// Initialize FluidAudio models
     func initialize() async throws {
         guard !isInitialized else { return }
-        
-        // Download and load ASR models (Parakeet v3 for multilingual)
+
+        // Download/load ASR (Parakeet v3 for multilingual) and diarization models
+        // concurrently - the downloads and CoreML compilation are independent,
+        // so cold start takes max(asr, diarization) instead of their sum
         emit(ProgressMessage(stage: "asr", message: "Downloading ASR model (~600MB)...", percent: nil))
-        let asrModels = try await AsrModels.downloadAndLoad(version: .v3)
+        emit(ProgressMessage(stage: "diarization", message: "Downloading diarization model (~50MB)...", percent: nil))
+        async let pendingAsrModels = AsrModels.downloadAndLoad(version: .v3)
+        async let pendingDiarizerModels = DiarizerModels.downloadIfNeeded()
+
+        let asrModels = try await pendingAsrModels
         emit(ProgressMessage(stage: "asr", message: "Initializing ASR...", percent: 80))
         asrManager = AsrManager(config: .default)
         try await asrManager?.initialize(models: asrModels)
         emit(ProgressMessage(stage: "asr", message: "ASR ready", percent: 100))
-        
-        // Download and load diarization models
-        emit(ProgressMessage(stage: "diarization", message: "Downloading diarization model (~50MB)...", percent: nil))
-        let diarizerModels = try await DiarizerModels.downloadIfNeeded()
+
+        let diarizerModels = try await pendingDiarizerModels
         emit(ProgressMessage(stage: "diarization", message: "Initializing diarization...", percent: 80))
         diarizer = DiarizerManager()
         diarizer?.initialize(models: diarizerModels)
@@ -141,6 +150,9 @@ actor AudioProcessor {
         // Reset state for new recording
         sampleBuffer.removeAll()
         batchBuffer.removeAll()
+        // The ASR batch size is fixed, so reserve the buffer once up front
+        // (plus a chunk of headroom) instead of reallocating as chunks append
+        batchBuffer.reserveCapacity(batchSamples + Int(sampleRate))
         collectedSegments.removeAll()
         totalSpeakers = 0
         lastEmittedEnd = 0
@@ -207,8 +219,8 @@ actor AudioProcessor {
     
     /// Process an incoming audio chunk: accumulate in batch buffer; run ASR every 15 seconds
     private func processStreamingChunk(_ samples: [Float]) async {
-        // Accumulate for full recording and for batching
-        sampleBuffer.append(contentsOf: samples)
+        // Accumulate for batching only - ASR runs per batch, so retaining the
+        // full session in sampleBuffer would just grow memory unboundedly
         batchBuffer.append(contentsOf: samples)
         
         // Feed to audio stream for real-time diarization (speaker updates)
@@ -303,45 +315,56 @@ actor AudioProcessor {
     }
     
     private func extractSpeakerId(from speakerLabel: String) -> Int {
+        if let cached = speakerIdCache[speakerLabel] {
+            return cached
+        }
         // Extract numeric ID from labels like "Speaker_0" or "SPEAKER_01"
         let digits = speakerLabel.filter { $0.isNumber }
-        return Int(digits) ?? 0
+        let speakerId = Int(digits) ?? 0
+        speakerIdCache[speakerLabel] = speakerId
+        return speakerId
     }
     
     private func convertPCMToFloat32(data: Data) -> [Float] {
-        // PCM Int16 to Float32 conversion
+        // PCM Int16 to Float32 conversion, vectorized via vDSP
         let int16Count = data.count / 2
+        guard int16Count > 0 else { return [] }
+
         var floatSamples = [Float](repeating: 0, count: int16Count)
-        
+
         data.withUnsafeBytes { rawBuffer in
             let int16Buffer = rawBuffer.bindMemory(to: Int16.self)
-            for i in 0..<int16Count {
-                floatSamples[i] = Float(int16Buffer[i]) / Float(Int16.max)
-            }
+            vDSP_vflt16(int16Buffer.baseAddress!, 1, &floatSamples, 1, vDSP_Length(int16Count))
         }
-        
+
+        // Normalize to [-1, 1] in place
+        var scale = Float(1.0) / Float(Int16.max)
+        floatSamples.withUnsafeMutableBufferPointer { buffer in
+            vDSP_vsmul(buffer.baseAddress!, 1, &scale, buffer.baseAddress!, 1, vDSP_Length(int16Count))
+        }
+
         return floatSamples
     }
     
     private func resample(_ samples: [Float], from sourceSampleRate: Int, to targetSampleRate: Int) -> [Float] {
-        // Simple linear interpolation resampling
+        // Linear interpolation resampling, vectorized via vDSP
         let ratio = Double(sourceSampleRate) / Double(targetSampleRate)
         let newLength = Int(Double(samples.count) / ratio)
-        
+        guard newLength > 0, !samples.isEmpty else { return [] }
+
+        // Fractional source index for each output sample
+        var indices = [Float](repeating: 0, count: newLength)
+        var rampStart = Float(0)
+        var rampStep = Float(ratio)
+        vDSP_vramp(&rampStart, &rampStep, &indices, 1, vDSP_Length(newLength))
+
+        // Duplicate the final sample so interpolation at the last index stays in bounds
+        var padded = samples
+        padded.append(samples[samples.count - 1])
+
         var resampled = [Float](repeating: 0, count: newLength)
-        
-        for i in 0..<newLength {
-            let srcIndex = Double(i) * ratio
-            let srcIndexInt = Int(srcIndex)
-            let fraction = Float(srcIndex - Double(srcIndexInt))
-            
-            if srcIndexInt + 1 < samples.count {
-                resampled[i] = samples[srcIndexInt] * (1 - fraction) + samples[srcIndexInt + 1] * fraction
-            } else if srcIndexInt < samples.count {
-                resampled[i] = samples[srcIndexInt]
-            }
-        }
-        
+        vDSP_vlint(padded, indices, 1, &resampled, 1, vDSP_Length(newLength), vDSP_Length(padded.count))
+
         return resampled
     }
 }
@@ -11,7 +11,11 @@ class AudioRecorder {
     private let engine = AVAudioEngine()
     private var isRecording = false
     private let targetSampleRate: Double = 16000
-    
+
+    // Reusable conversion output buffer - allocated once and shared across tap
+    // callbacks (only the audio thread touches it) instead of per-callback
+    private var conversionBuffer: AVAudioPCMBuffer?
+
     /// Callback invoked for each audio chunk (called on audio thread)
     var onAudioChunk: AudioChunkHandler?
     
@@ -137,9 +141,15 @@ class AudioRecorder {
         
         // Create sample rate converter if needed
         let converter = AVAudioConverter(from: inputFormat, to: outputFormat)
-        
-        // Install tap - streams audio in real-time
-        inputNode.installTap(onBus: 0, bufferSize: 1600, format: inputFormat) { [weak self] buffer, _ in
+
+        // Drop any staging buffer from a previous recording - the input device
+        // (and therefore the converted chunk size) may have changed
+        conversionBuffer = nil
+
+        // Install tap - streams audio in real-time. 4800 frames (~0.1s at 48kHz)
+        // amortizes the per-callback conversion and dispatch overhead; still far
+        // below the 5s diarization chunks and 15s ASR batches downstream
+        inputNode.installTap(onBus: 0, bufferSize: 4800, format: inputFormat) { [weak self] buffer, _ in
             guard let self = self, let handler = self.onAudioChunk else { return }
             
             var samples: [Float] = []
@@ -149,13 +159,29 @@ class AudioRecorder {
                 let frameCount = AVAudioFrameCount(
                     Double(buffer.frameLength) * self.targetSampleRate / inputFormat.sampleRate
                 )
-                guard let convertedBuffer = AVAudioPCMBuffer(
-                    pcmFormat: outputFormat,
-                    frameCapacity: frameCount
-                ) else { return }
-                
+                // Reuse the staging buffer across callbacks; regrow only if an
+                // unusually large input buffer arrives
+                if self.conversionBuffer == nil || self.conversionBuffer!.frameCapacity < frameCount {
+                    self.conversionBuffer = AVAudioPCMBuffer(
+                        pcmFormat: outputFormat,
+                        frameCapacity: frameCount
+                    )
+                }
+                guard let convertedBuffer = self.conversionBuffer else { return }
+                convertedBuffer.frameLength = 0
+
+                // Supply the tap buffer exactly once per convert call. The
+                // converter keeps pulling input until the output buffer is full
+                // to frameCapacity, so a reused buffer larger than this chunk
+                // would otherwise re-read the same input and duplicate audio
+                var suppliedInput = false
                 var error: NSError?
                 converter.convert(to: convertedBuffer, error: &error) { _, outStatus in
+                    if suppliedInput {
+                        outStatus.pointee = .noDataNow
+                        return nil
+                    }
+                    suppliedInput = true
                     outStatus.pointee = .haveData
                     return buffer
                 }
@@ -134,12 +134,17 @@ func emitDebug(_ message: String) {
 
 // MARK: - Output Helper
 
-func emit<T: Encodable>(_ message: T) {
+// Shared encoder - emit() runs for every segment, speaker and volatile update
+// while recording, so don't rebuild the encoder per message
+private let messageEncoder: JSONEncoder = {
     let encoder = JSONEncoder()
     encoder.outputFormatting = []  // Compact output (no pretty printing)
-    
+    return encoder
+}()
+
+func emit<T: Encodable>(_ message: T) {
     do {
-        let data = try encoder.encode(message)
+        let data = try messageEncoder.encode(message)
         if let jsonString = String(data: data, encoding: .utf8) {
             print(jsonString)
             fflush(stdout)
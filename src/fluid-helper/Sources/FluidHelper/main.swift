@@ -3,13 +3,16 @@ import Foundation
 /// fluid-helper: A command-line tool for real-time audio transcription and speaker diarization
 /// using FluidAudio. Communicates via stdin/stdout with newline-delimited JSON.
 
+// Shared decoder - audio messages arrive many times per second, so don't
+// pay for a fresh JSONDecoder on every line
+let inputDecoder = JSONDecoder()
+
 func processLine(_ line: String, processor: AudioProcessor) async {
     guard !line.isEmpty else { return }
-    
+
     do {
         let data = Data(line.utf8)
-        let decoder = JSONDecoder()
-        let message = try decoder.decode(InputMessage.self, from: data)
+        let message = try inputDecoder.decode(InputMessage.self, from: data)
         
         switch message {
         case .initialize:
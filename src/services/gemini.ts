@@ -176,7 +176,7 @@ Process the segments above:`;
     const segment = segments[i];
 
     if (
-      !VALID_CLASSIFICATIONS.includes(
+      !VALID_CLASSIFICATIONS.has(
         resultItem.classification as SegmentClassification,
       )
     ) {
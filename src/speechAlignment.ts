@@ -24,6 +24,24 @@ function findSymbolByName(
   return null;
 }
 
+/**
+ * Query document symbols once for a document
+ * Returns undefined when the provider is unavailable or fails
+ */
+async function getDocumentSymbols(
+  document: vscode.TextDocument,
+): Promise<vscode.DocumentSymbol[] | undefined> {
+  try {
+    const symbols = await vscode.commands.executeCommand<
+      vscode.DocumentSymbol[]
+    >("vscode.executeDocumentSymbolProvider", document.uri);
+    return Array.isArray(symbols) ? symbols : undefined;
+  } catch (error) {
+    console.warn("Failed to query document symbols:", error);
+    return undefined;
+  }
+}
+
 /**
  * Create a range for a specific line in a document
  */
@@ -81,65 +99,65 @@ export function findNearestContexts(
 
   const candidates = filterContextsByFile(contexts, currentFile);
 
-  // Sort by absolute time difference
-  const sorted = [...candidates].sort((a, b) => {
-    const diffA = Math.abs(a.timestamp - timestamp);
-    const diffB = Math.abs(b.timestamp - timestamp);
-    return diffA - diffB;
-  });
+  // Single pass keeping the n nearest seen so far (ascending time difference)
+  // instead of copying and sorting the full snapshot list
+  const nearest: { context: RecordingContext; diff: number }[] = [];
+  for (const context of candidates) {
+    const diff = Math.abs(context.timestamp - timestamp);
+    if (nearest.length === n && diff >= nearest[n - 1].diff) {
+      continue;
+    }
+    let i = nearest.length;
+    while (i > 0 && nearest[i - 1].diff > diff) {
+      i--;
+    }
+    nearest.splice(i, 0, { context, diff });
+    if (nearest.length > n) {
+      nearest.pop();
+    }
+  }
 
-  // Return top N
-  return sorted.slice(0, Math.min(n, sorted.length));
+  return nearest.map((entry) => entry.context);
 }
 
 /**
  * Extract code context around visible symbols from a document
+ * Takes pre-fetched document symbols so batch callers query the symbol
+ * provider once instead of once per candidate
  * Returns formatted code snippet with line numbers
  */
-export async function extractCodeContext(
+export function extractCodeContext(
   context: RecordingContext,
   document: vscode.TextDocument,
-): Promise<string> {
+  symbols: vscode.DocumentSymbol[] | undefined,
+): string {
   const lineCount = document.lineCount;
   const codeSnippets: string[] = [];
 
   // Try to extract code around visible symbols
-  if (context.symbolsInView && context.symbolsInView.length > 0) {
-    try {
-      const symbols = await vscode.commands.executeCommand<
-        vscode.DocumentSymbol[]
-      >("vscode.executeDocumentSymbolProvider", document.uri);
+  if (symbols && context.symbolsInView && context.symbolsInView.length > 0) {
+    const PADDING = 2; // Lines of context around symbol
+
+    for (const symbolName of context.symbolsInView) {
+      const symbol = findSymbolByName(symbols, symbolName);
+      if (symbol) {
+        const startLine = Math.max(0, symbol.range.start.line - PADDING);
+        const endLine = Math.min(
+          lineCount - 1,
+          symbol.range.end.line + PADDING,
+        );
 
-      if (symbols && Array.isArray(symbols)) {
-        const PADDING = 2; // Lines of context around symbol
+        // Extract code lines
+        const lines: string[] = [];
+        for (let lineNum = startLine; lineNum <= endLine; lineNum++) {
+          const line = document.lineAt(lineNum);
+          lines.push(`${lineNum + 1}: ${line.text}`);
+        }
 
-        for (const symbolName of context.symbolsInView) {
-          const symbol = findSymbolByName(symbols, symbolName);
-          if (symbol) {
-            const startLine = Math.max(0, symbol.range.start.line - PADDING);
-            const endLine = Math.min(
-              lineCount - 1,
-              symbol.range.end.line + PADDING,
-            );
-
-            // Extract code lines
-            const lines: string[] = [];
-            for (let lineNum = startLine; lineNum <= endLine; lineNum++) {
-              const line = document.lineAt(lineNum);
-              lines.push(`${lineNum + 1}: ${line.text}`);
-            }
-
-            if (lines.length > 0) {
-              codeSnippets.push(`Symbol: ${symbolName}\n${lines.join("\n")}`);
-            }
-          }
+        if (lines.length > 0) {
+          codeSnippets.push(`Symbol: ${symbolName}\n${lines.join("\n")}`);
         }
       }
-    } catch (error) {
-      console.warn(
-        "Failed to query document symbols for code extraction:",
-        error,
-      );
     }
   }
 
@@ -201,31 +219,26 @@ export async function findCommentLocationsBatch(
 ): Promise<vscode.Range[]> {
   const lineCount = document.lineCount;
 
+  // Query the symbol provider once for the whole batch - the result is reused
+  // for every candidate's code context and for comment placement below
+  const documentSymbols = await getDocumentSymbols(document);
+
   // Extract candidate contexts for all segments
   const allCandidateContexts = segments.map((segment) =>
     findNearestContexts(segment.startTime, contexts, 5, currentFile),
   );
 
-  // Extract code context for all candidates in parallel
-  const allCandidates: CandidateLocation[][] = await Promise.all(
-    allCandidateContexts.map(async (candidateContexts) => {
-      if (candidateContexts.length === 0) {
-        return [];
-      }
-      return Promise.all(
-        candidateContexts.map(async (context) => {
-          const codeContext = await extractCodeContext(context, document);
-          return {
-            timestamp: context.timestamp,
-            file: context.file,
-            cursorLine: context.cursorLine,
-            visibleRange: context.visibleRange as [number, number],
-            symbolsInView: context.symbolsInView,
-            codeContext: codeContext,
-          };
-        }),
-      );
-    }),
+  // Extract code context for all candidates
+  const allCandidates: CandidateLocation[][] = allCandidateContexts.map(
+    (candidateContexts) =>
+      candidateContexts.map((context) => ({
+        timestamp: context.timestamp,
+        file: context.file,
+        cursorLine: context.cursorLine,
+        visibleRange: context.visibleRange as [number, number],
+        symbolsInView: context.symbolsInView,
+        codeContext: extractCodeContext(context, document, documentSymbols),
+      })),
   );
 
   // Prepare batch request
@@ -272,33 +285,21 @@ export async function findCommentLocationsBatch(
 
       // Try visible symbols
       if (
+        documentSymbols &&
         selectedCandidate.symbolsInView &&
         selectedCandidate.symbolsInView.length > 0
       ) {
-        try {
-          const symbols = await vscode.commands.executeCommand<
-            vscode.DocumentSymbol[]
-          >("vscode.executeDocumentSymbolProvider", document.uri);
-
-          if (symbols && Array.isArray(symbols)) {
-            let foundSymbol = false;
-            for (const symbolName of selectedCandidate.symbolsInView) {
-              const symbol = findSymbolByName(symbols, symbolName);
-              if (symbol) {
-                ranges.push(createLineRange(document, symbol.range.start.line));
-                foundSymbol = true;
-                break;
-              }
-            }
-            if (foundSymbol) {
-              continue;
-            }
+        let foundSymbol = false;
+        for (const symbolName of selectedCandidate.symbolsInView) {
+          const symbol = findSymbolByName(documentSymbols, symbolName);
+          if (symbol) {
+            ranges.push(createLineRange(document, symbol.range.start.line));
+            foundSymbol = true;
+            break;
           }
-        } catch (error) {
-          console.warn(
-            "Failed to query document symbols for comment placement:",
-            error,
-          );
+        }
+        if (foundSymbol) {
+          continue;
         }
       }
 
@@ -36,6 +36,11 @@ export class TranscriptPanelProvider implements vscode.WebviewViewProvider {
     // Handle messages from the webview
     webviewView.webview.onDidReceiveMessage((data) => {
       switch (data.type) {
+        case "ready":
+          // Webview script is attached - sync current state in case the view
+          // was (re-)created mid-session
+          this._updateView();
+          break;
         case "clear":
           this.clear();
           break;
@@ -56,10 +61,16 @@ export class TranscriptPanelProvider implements vscode.WebviewViewProvider {
 
   /**
    * Update volatile (interim) transcription text
+   * Sends only the interim text - the webview patches the volatile node in
+   * place instead of rebuilding the whole transcript
    */
   public updateVolatile(text: string) {
     this._volatileText = text;
-    this._updateView();
+    this._view?.webview.postMessage({
+      type: "volatile",
+      text,
+      speakerId: this._currentSpeaker,
+    });
   }
 
   /**
@@ -71,11 +82,13 @@ export class TranscriptPanelProvider implements vscode.WebviewViewProvider {
 
   /**
    * Add a final segment
+   * Sends only the new entry - re-sending the full entries array (and
+   * rebuilding the webview DOM) made every segment cost O(transcript length)
    */
   public addSegment(entry: TranscriptEntry) {
     this._entries.push(entry);
     this._volatileText = ""; // Clear volatile when we get a final segment
-    this._updateView();
+    this._view?.webview.postMessage({ type: "append", entry });
   }
 
   /**
@@ -281,7 +294,8 @@ export class TranscriptPanelProvider implements vscode.WebviewViewProvider {
         const clearBtn = document.getElementById('clearBtn');
         
         let currentEntries = [];
-        
+        let volatileEl = null;
+
         function formatTime(seconds) {
             const mins = Math.floor(seconds / 60);
             const secs = Math.floor(seconds % 60);
@@ -317,10 +331,61 @@ export class TranscriptPanelProvider implements vscode.WebviewViewProvider {
             return div.innerHTML;
         }
         
+        function removeEmptyState() {
+            const placeholder = transcriptContainer.querySelector('.empty-state');
+            if (placeholder) {
+                placeholder.remove();
+            }
+        }
+
+        function scrollToBottom() {
+            transcriptContainer.scrollTop = transcriptContainer.scrollHeight;
+        }
+
+        // Append a single final segment without rebuilding the transcript
+        function appendEntry(entry) {
+            currentEntries.push(entry);
+            removeEmptyState();
+            if (volatileEl) {
+                volatileEl.remove();
+                volatileEl = null;
+            }
+            transcriptContainer.appendChild(renderSegment(entry));
+            clearBtn.style.display = 'block';
+            scrollToBottom();
+        }
+
+        // Patch the volatile (interim) node in place
+        function updateVolatile(text, speakerId) {
+            if (!text) {
+                if (volatileEl) {
+                    volatileEl.remove();
+                    volatileEl = null;
+                }
+                return;
+            }
+            removeEmptyState();
+            const node = renderSegment({
+                speakerId: speakerId,
+                text: text,
+                startTime: 0,
+                endTime: 0
+            }, true);
+            if (volatileEl) {
+                volatileEl.replaceWith(node);
+            } else {
+                transcriptContainer.appendChild(node);
+            }
+            volatileEl = node;
+            scrollToBottom();
+        }
+
+        // Full rebuild - used for initial sync, clear, and recording state changes
         function updateUI(data) {
             const { entries, volatileText, volatileSpeaker, isRecording } = data;
             currentEntries = entries;
-            
+            volatileEl = null;
+
             // Update status
             if (isRecording) {
                 statusDot.classList.add('recording');
@@ -329,43 +394,51 @@ export class TranscriptPanelProvider implements vscode.WebviewViewProvider {
                 statusDot.classList.remove('recording');
                 statusText.textContent = entries.length > 0 ? entries.length + ' segment(s)' : 'Idle';
             }
-            
+
             // Clear and rebuild transcript
             transcriptContainer.innerHTML = '';
-            
+
             if (entries.length === 0 && !volatileText) {
                 transcriptContainer.appendChild(emptyState.cloneNode(true));
                 clearBtn.style.display = 'none';
                 return;
             }
-            
+
             // Render final segments
             entries.forEach(entry => {
                 transcriptContainer.appendChild(renderSegment(entry));
             });
-            
+
             // Render volatile text if present
             if (volatileText && isRecording) {
-                transcriptContainer.appendChild(renderSegment({
+                volatileEl = renderSegment({
                     speakerId: volatileSpeaker,
                     text: volatileText,
                     startTime: 0,
                     endTime: 0
-                }, true));
+                }, true);
+                transcriptContainer.appendChild(volatileEl);
             }
-            
+
             // Show clear button if we have entries
             clearBtn.style.display = entries.length > 0 ? 'block' : 'none';
-            
-            // Scroll to bottom
-            transcriptContainer.scrollTop = transcriptContainer.scrollHeight;
+
+            scrollToBottom();
         }
-        
+
         // Handle messages from extension
         window.addEventListener('message', event => {
             const message = event.data;
-            if (message.type === 'update') {
-                updateUI(message);
+            switch (message.type) {
+                case 'update':
+                    updateUI(message);
+                    break;
+                case 'append':
+                    appendEntry(message.entry);
+                    break;
+                case 'volatile':
+                    updateVolatile(message.text, message.speakerId);
+                    break;
             }
         });
         
@@ -373,6 +446,9 @@ export class TranscriptPanelProvider implements vscode.WebviewViewProvider {
         clearBtn.addEventListener('click', () => {
             vscode.postMessage({ type: 'clear' });
         });
+
+        // Tell the extension we're ready so it can sync current state
+        vscode.postMessage({ type: 'ready' });
     </script>
 </body>
 </html>`;
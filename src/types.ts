@@ -10,13 +10,9 @@ export type SegmentClassification =
   | "Suggestion"
   | "Style";
 
-export const VALID_CLASSIFICATIONS: SegmentClassification[] = [
-  "Ignore",
-  "Question",
-  "Concern",
-  "Suggestion",
-  "Style",
-];
+// Set for O(1) membership checks when validating LLM responses
+export const VALID_CLASSIFICATIONS: ReadonlySet<SegmentClassification> =
+  new Set(["Ignore", "Question", "Concern", "Suggestion", "Style"]);
 
 export interface SpeakerSegment {
   speakerTag: number;